@@ -12,8 +12,11 @@ import typing
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import Mapping
 from typing import NoReturn
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import Union
@@ -22,14 +25,14 @@ from . import coercions
 from . import operators
 from . import roles
 from . import type_api
-from .elements import and_
+from .annotation import annotated_classes
 from .elements import BinaryExpression
+from .elements import BooleanClauseList
 from .elements import ClauseList
 from .elements import CollationClause
 from .elements import CollectionAggregate
 from .elements import False_
 from .elements import Null
-from .elements import or_
 from .elements import True_
 from .elements import UnaryExpression
 from .operators import OperatorType
@@ -40,9 +43,87 @@ _T = typing.TypeVar("_T", bound=Any)
 
 if typing.TYPE_CHECKING:
     from .elements import ColumnElement
+    from .operators import custom_op
     from .sqltypes import TypeEngine
 
 
+# Python types that _boolean_compare() renders as IS / IS NOT or
+# as constants rather than as bound parameters, unless the type
+# overrides them using TypeDecorator.coerce_to_is_types
+_PY_IS_TYPES = (util.NoneType, bool)
+
+# those types along with the SQL constants, as tested by isinstance()
+# in _boolean_compare() when coerce_to_is_types is not overridden
+_IS_TYPES = _PY_IS_TYPES + (Null, True_, False_)
+
+# the exact classes of those Python types and of the SQL constants,
+# including their annotated forms, so that the functions returned by
+# _boolean_compare_for() can test obj.__class__ against them rather than
+# calling isinstance().  none of these are subclassed other than by
+# annotation.
+_IS_CLASSES = frozenset(
+    _IS_TYPES + tuple(annotated_classes[cls] for cls in (Null, True_, False_))
+)
+
+
+def _const_expr(obj: Any) -> "ColumnElement":
+    # Null, True_ and False_ are singletons, so the Python constants
+    # can be mapped to them without running through coercions.expect()
+    if obj is None:
+        return Null._singleton
+    elif obj is True:
+        return True_._singleton
+    elif obj is False:
+        return False_._singleton
+    else:
+        return coercions.expect(roles.ConstExprRole, obj)
+
+
+def _boolean_compare_for(
+    negate_op: OperatorType,
+    modifiers: Mapping[str, Any] = util.EMPTY_DICT,
+) -> Callable[..., BinaryExpression[bool]]:
+    """Return a comparison function for an operator having the given
+    negation, producing expressions that carry the given modifiers.
+
+    The returned function handles the plain "<expr> <op> <value>" case
+    itself; constants, and calls passing additional arguments such as
+    ``reverse`` or ``escape``, are passed on to :func:`._boolean_compare`.
+
+    """
+
+    def specialized_compare(
+        expr: "ColumnElement",
+        op: OperatorType,
+        obj: Any,
+        *,
+        # module-level names used on every call, bound as locals
+        _is_classes: FrozenSet[type] = _IS_CLASSES,
+        _expect: Callable[..., Any] = coercions.expect,
+        _BinaryElementRole: Type[
+            roles.BinaryElementRole
+        ] = roles.BinaryElementRole,
+        _BinaryExpression: Type[BinaryExpression[bool]] = BinaryExpression,
+        _BOOLEANTYPE: "TypeEngine[bool]" = type_api.BOOLEANTYPE,
+        **kwargs: Any,
+    ) -> BinaryExpression[bool]:
+        if kwargs or obj.__class__ in _is_classes:
+            return _boolean_compare(
+                expr, op, obj, negate_op=negate_op, **modifiers, **kwargs
+            )
+
+        return _BinaryExpression(
+            expr,
+            _expect(_BinaryElementRole, element=obj, operator=op, expr=expr),
+            op,
+            type_=_BOOLEANTYPE,
+            negate=negate_op,
+            modifiers=modifiers,
+        )
+
+    return specialized_compare
+
+
 def _boolean_compare(
     expr: "ColumnElement",
     op: OperatorType,
@@ -50,8 +131,8 @@ def _boolean_compare(
     *,
     negate_op: Optional[OperatorType] = None,
     reverse: bool = False,
-    _python_is_types=(util.NoneType, bool),
-    _any_all_expr=False,
+    _python_is_types: Tuple[type, ...] = _PY_IS_TYPES,
+    _any_all_expr: bool = False,
     result_type: Optional[
         Union[Type["TypeEngine[bool]"], "TypeEngine[bool]"]
     ] = None,
@@ -61,7 +142,14 @@ def _boolean_compare(
     if result_type is None:
         result_type = type_api.BOOLEANTYPE
 
-    if isinstance(obj, _python_is_types + (Null, True_, False_)):
+    modifiers = kwargs or util.EMPTY_DICT
+
+    if _python_is_types is _PY_IS_TYPES:
+        is_types = _IS_TYPES
+    else:
+        is_types = _python_is_types + (Null, True_, False_)
+
+    if isinstance(obj, is_types):
         # allow x ==/!= True/False to be treated as a literal.
         # this comes out to "== / != true/false" or "1/0" if those
         # constants aren't supported and works on all platforms
@@ -70,11 +158,11 @@ def _boolean_compare(
         ):
             return BinaryExpression(
                 expr,
-                coercions.expect(roles.ConstExprRole, obj),
+                _const_expr(obj),
                 op,
                 type_=result_type,
                 negate=negate_op,
-                modifiers=kwargs,
+                modifiers=modifiers,
             )
         elif op in (
             operators.is_distinct_from,
@@ -82,33 +170,33 @@ def _boolean_compare(
         ):
             return BinaryExpression(
                 expr,
-                coercions.expect(roles.ConstExprRole, obj),
+                _const_expr(obj),
                 op,
                 type_=result_type,
                 negate=negate_op,
-                modifiers=kwargs,
+                modifiers=modifiers,
             )
         elif _any_all_expr:
-            obj = coercions.expect(
-                roles.ConstExprRole, element=obj, operator=op, expr=expr
-            )
+            obj = _const_expr(obj)
         else:
             # all other None uses IS, IS NOT
             if op in (operators.eq, operators.is_):
                 return BinaryExpression(
                     expr,
-                    coercions.expect(roles.ConstExprRole, obj),
+                    _const_expr(obj),
                     operators.is_,
                     negate=operators.is_not,
                     type_=result_type,
+                    modifiers=util.EMPTY_DICT,
                 )
             elif op in (operators.ne, operators.is_not):
                 return BinaryExpression(
                     expr,
-                    coercions.expect(roles.ConstExprRole, obj),
+                    _const_expr(obj),
                     operators.is_not,
                     negate=operators.is_,
                     type_=result_type,
+                    modifiers=util.EMPTY_DICT,
                 )
             else:
                 raise exc.ArgumentError(
@@ -128,7 +216,7 @@ def _boolean_compare(
             op,
             type_=result_type,
             negate=negate_op,
-            modifiers=kwargs,
+            modifiers=modifiers,
         )
     else:
         return BinaryExpression(
@@ -137,11 +225,20 @@ def _boolean_compare(
             op,
             type_=result_type,
             negate=negate_op,
-            modifiers=kwargs,
+            modifiers=modifiers,
         )
 
 
-def _custom_op_operate(expr, op, obj, reverse=False, result_type=None, **kw):
+def _custom_op_operate(
+    expr: "ColumnElement",
+    op: "custom_op",
+    obj: Any,
+    reverse: bool = False,
+    result_type: Optional[
+        Union[Type["TypeEngine[Any]"], "TypeEngine[Any]"]
+    ] = None,
+    **kw: Any,
+) -> "ColumnElement":
     if result_type is None:
         if op.return_type:
             result_type = op.return_type
@@ -158,7 +255,7 @@ def _binary_operate(
     op: OperatorType,
     obj: roles.BinaryElementRole,
     *,
-    reverse=False,
+    reverse: bool = False,
     result_type: Optional[
         Union[Type["TypeEngine[_T]"], "TypeEngine[_T]"]
     ] = None,
@@ -179,36 +276,103 @@ def _binary_operate(
             op, right.comparator
         )
 
-    return BinaryExpression(left, right, op, type_=result_type, modifiers=kw)
+    return BinaryExpression(
+        left, right, op, type_=result_type, modifiers=kw or util.EMPTY_DICT
+    )
+
+
+def _conjunction_clauses(
+    op: OperatorType, elem: "ColumnElement"
+) -> Sequence["ColumnElement"]:
+    # an and_() / or_() against the same operator contributes its
+    # individual clauses, so that a chain such as "a & b & c" produces a
+    # single BooleanClauseList rather than nesting one per operation.
+    # annotated versions are left intact.
+    if elem.__class__ is BooleanClauseList and elem.operator is op:
+        return elem.clauses
+    else:
+        return (elem,)
 
 
-def _conjunction_operate(expr, op, other, **kw) -> "ColumnElement":
+def _conjunction_operate(
+    expr: "ColumnElement", op: OperatorType, other: Any
+) -> "ColumnElement":
     if op is operators.and_:
-        return and_(expr, other)
+        continue_on, skip_on = True_._singleton, False_._singleton
     elif op is operators.or_:
-        return or_(expr, other)
+        continue_on, skip_on = False_._singleton, True_._singleton
     else:
         raise NotImplementedError()
 
+    # expr is already a column expression; only the other side needs
+    # coercion before the steps BooleanClauseList._construct() would
+    # otherwise perform
+    other = coercions.expect(roles.WhereHavingRole, other)
+
+    lcc, clauses = BooleanClauseList._process_clauses_for_boolean(
+        op,
+        continue_on,
+        skip_on,
+        [*_conjunction_clauses(op, expr), *_conjunction_clauses(op, other)],
+    )
+
+    if lcc > 1:
+        return BooleanClauseList._construct_raw(op, clauses)
+    elif lcc == 1:
+        return clauses[0]
+    else:
+        # both sides were empty and_() / or_() constructs
+        return BooleanClauseList._construct_raw(op)
+
 
-def _scalar(expr, op, fn, **kw) -> "ColumnElement":
+def _scalar(
+    expr: "ColumnElement",
+    op: OperatorType,
+    fn: Callable[["ColumnElement"], "ColumnElement"],
+) -> "ColumnElement":
     return fn(expr)
 
 
-def _in_impl(expr, op, seq_or_selectable, negate_op, **kw) -> "ColumnElement":
+def _in_impl(
+    expr: "ColumnElement",
+    op: OperatorType,
+    seq_or_selectable: Any,
+    *,
+    compare: Callable[..., BinaryExpression[bool]],
+    # module-level name used for every element, bound as a local
+    _is_literal: Callable[[Any], bool] = coercions._is_literal,
+    **kw: Any,
+) -> "ColumnElement":
+    cls = seq_or_selectable.__class__
+    if cls is list or cls is tuple:
+        values = list(seq_or_selectable)
+        for value in values:
+            if value is None or not _is_literal(value):
+                break
+        else:
+            # the common case of a plain list of values; produce the
+            # "expanding" parameter InElementImpl would, without going
+            # through the full coercion
+            bind = expr._bind_param(op, values, expanding=True)
+            bind.expand_op = op
+            return compare(expr, op, bind, **kw)
+
     seq_or_selectable = coercions.expect(
         roles.InElementRole, seq_or_selectable, expr=expr, operator=op
     )
     if "in_ops" in seq_or_selectable._annotations:
         op, negate_op = seq_or_selectable._annotations["in_ops"]
+        return _boolean_compare(
+            expr, op, seq_or_selectable, negate_op=negate_op, **kw
+        )
 
-    return _boolean_compare(
-        expr, op, seq_or_selectable, negate_op=negate_op, **kw
-    )
+    return compare(expr, op, seq_or_selectable, **kw)
 
 
-def _getitem_impl(expr, op, other, **kw) -> "ColumnElement":
-    if isinstance(expr.type, type_api.INDEXABLE):
+def _getitem_impl(
+    expr: "ColumnElement", op: OperatorType, other: Any, **kw: Any
+) -> "ColumnElement":
+    if expr.type._indexable:
         other = coercions.expect(
             roles.BinaryElementRole, other, expr=expr, operator=op
         )
@@ -217,13 +381,15 @@ def _getitem_impl(expr, op, other, **kw) -> "ColumnElement":
         _unsupported_impl(expr, op, other, **kw)
 
 
-def _unsupported_impl(expr, op, *arg, **kw) -> NoReturn:
+def _unsupported_impl(
+    expr: "ColumnElement", op: OperatorType, *arg: Any, **kw: Any
+) -> NoReturn:
     raise NotImplementedError(
         "Operator '%s' is not supported on " "this expression" % op.__name__
     )
 
 
-def _inv_impl(expr, op, **kw) -> "ColumnElement":
+def _inv_impl(expr: "ColumnElement", op: OperatorType) -> "ColumnElement":
     """See :meth:`.ColumnOperators.__inv__`."""
 
     # undocumented element currently used by the ORM for
@@ -234,12 +400,18 @@ def _inv_impl(expr, op, **kw) -> "ColumnElement":
         return expr._negate()
 
 
-def _neg_impl(expr, op, **kw) -> "ColumnElement":
+def _neg_impl(expr: "ColumnElement", op: OperatorType) -> "ColumnElement":
     """See :meth:`.ColumnOperators.__neg__`."""
     return UnaryExpression(expr, operator=operators.neg, type_=expr.type)
 
 
-def _match_impl(expr, op, other, **kw) -> "ColumnElement":
+def _match_impl(
+    expr: "ColumnElement",
+    op: OperatorType,
+    other: Any,
+    negate_op: OperatorType,
+    **kw: Any,
+) -> "ColumnElement":
     """See :meth:`.ColumnOperators.match`."""
 
     return _boolean_compare(
@@ -252,37 +424,57 @@ def _match_impl(expr, op, other, **kw) -> "ColumnElement":
             operator=operators.match_op,
         ),
         result_type=type_api.MATCHTYPE,
-        negate_op=operators.not_match_op
-        if op is operators.match_op
-        else operators.match_op,
+        negate_op=negate_op,
         **kw,
     )
 
 
-def _distinct_impl(expr, op, **kw) -> "ColumnElement":
+def _distinct_impl(expr: "ColumnElement", op: OperatorType) -> "ColumnElement":
     """See :meth:`.ColumnOperators.distinct`."""
     return UnaryExpression(
         expr, operator=operators.distinct_op, type_=expr.type
     )
 
 
-def _between_impl(expr, op, cleft, cright, **kw) -> "ColumnElement":
+def _between_impl(
+    expr: "ColumnElement", op: OperatorType, cleft: Any, cright: Any, **kw: Any
+) -> "ColumnElement":
     """See :meth:`.ColumnOperators.between`."""
+    if coercions._is_literal(cleft) and coercions._is_literal(cright):
+        # the common case of two plain values; produce the bound
+        # parameters BinaryElementImpl would, without going through the
+        # full coercion for each
+        cleft = expr._bind_param(operators.and_, cleft)
+        cright = expr._bind_param(operators.and_, cright)
+
+        # as in BinaryElementImpl._post_coercion(), a bound parameter
+        # whose type could not be determined takes on that of expr
+        if not expr.type._isnull:
+            if cleft.type._isnull:
+                cleft = cleft._with_binary_element_type(expr.type)
+            if cright.type._isnull:
+                cright = cright._with_binary_element_type(expr.type)
+    else:
+        cleft = coercions.expect(
+            roles.BinaryElementRole,
+            cleft,
+            expr=expr,
+            operator=operators.and_,
+        )
+        cright = coercions.expect(
+            roles.BinaryElementRole,
+            cright,
+            expr=expr,
+            operator=operators.and_,
+        )
+
     return BinaryExpression(
         expr,
-        ClauseList(
-            coercions.expect(
-                roles.BinaryElementRole,
-                cleft,
-                expr=expr,
-                operator=operators.and_,
-            ),
-            coercions.expect(
-                roles.BinaryElementRole,
-                cright,
-                expr=expr,
-                operator=operators.and_,
-            ),
+        # the bounds are coerced already; don't have ClauseList() coerce
+        # them a second time
+        ClauseList._construct_for_coerced(
+            cleft,
+            cright,
             operator=operators.and_,
             group=False,
             group_contents=False,
@@ -291,36 +483,49 @@ def _between_impl(expr, op, cleft, cright, **kw) -> "ColumnElement":
         negate=operators.not_between_op
         if op is operators.between_op
         else operators.between_op,
-        modifiers=kw,
+        modifiers=kw or util.EMPTY_DICT,
     )
 
 
-def _collate_impl(expr, op, collation, **kw) -> "ColumnElement":
+def _collate_impl(
+    expr: "ColumnElement", op: OperatorType, collation: str
+) -> "ColumnElement":
     return CollationClause._create_collation_expression(expr, collation)
 
 
-def _regexp_match_impl(expr, op, pattern, flags, **kw) -> "ColumnElement":
-    if flags is not None:
-        flags = coercions.expect(
-            roles.BinaryElementRole,
-            flags,
-            expr=expr,
-            operator=operators.regexp_replace_op,
-        )
+def _regexp_match_impl(
+    expr: "ColumnElement",
+    op: OperatorType,
+    pattern: Any,
+    flags: Optional[str],
+    negate_op: OperatorType,
+    compare_no_flags: Callable[..., BinaryExpression[bool]],
+    **kw: Any,
+) -> "ColumnElement":
+    if flags is None:
+        return compare_no_flags(expr, op, pattern, **kw)
     return _boolean_compare(
         expr,
         op,
         pattern,
-        flags=flags,
-        negate_op=operators.not_regexp_match_op
-        if op is operators.regexp_match_op
-        else operators.regexp_match_op,
+        flags=coercions.expect(
+            roles.BinaryElementRole,
+            flags,
+            expr=expr,
+            operator=operators.regexp_replace_op,
+        ),
+        negate_op=negate_op,
         **kw,
     )
 
 
 def _regexp_replace_impl(
-    expr, op, pattern, replacement, flags, **kw
+    expr: "ColumnElement",
+    op: OperatorType,
+    pattern: Any,
+    replacement: Any,
+    flags: Optional[str],
+    **kw: Any,
 ) -> "ColumnElement":
     replacement = coercions.expect(
         roles.BinaryElementRole,
@@ -329,130 +534,121 @@ def _regexp_replace_impl(
         operator=operators.regexp_replace_op,
     )
     if flags is not None:
-        flags = coercions.expect(
+        flags_expr = coercions.expect(
             roles.BinaryElementRole,
             flags,
             expr=expr,
             operator=operators.regexp_replace_op,
         )
+    else:
+        flags_expr = None
     return _binary_operate(
-        expr, op, pattern, replacement=replacement, flags=flags, **kw
+        expr, op, pattern, replacement=replacement, flags=flags_expr, **kw
     )
 
 
-# a mapping of operators with the method they use, along with
-# additional keyword arguments to be passed
-operator_lookup: Dict[
-    str, Tuple[Callable[..., "ColumnElement"], util.immutabledict]
-] = {
-    "and_": (_conjunction_operate, util.EMPTY_DICT),
-    "or_": (_conjunction_operate, util.EMPTY_DICT),
-    "inv": (_inv_impl, util.EMPTY_DICT),
-    "add": (_binary_operate, util.EMPTY_DICT),
-    "mul": (_binary_operate, util.EMPTY_DICT),
-    "sub": (_binary_operate, util.EMPTY_DICT),
-    "div": (_binary_operate, util.EMPTY_DICT),
-    "mod": (_binary_operate, util.EMPTY_DICT),
-    "truediv": (_binary_operate, util.EMPTY_DICT),
-    "floordiv": (_binary_operate, util.EMPTY_DICT),
-    "custom_op": (_custom_op_operate, util.EMPTY_DICT),
-    "json_path_getitem_op": (_binary_operate, util.EMPTY_DICT),
-    "json_getitem_op": (_binary_operate, util.EMPTY_DICT),
-    "concat_op": (_binary_operate, util.EMPTY_DICT),
-    "any_op": (
-        _scalar,
-        util.immutabledict({"fn": CollectionAggregate._create_any}),
-    ),
-    "all_op": (
-        _scalar,
-        util.immutabledict({"fn": CollectionAggregate._create_all}),
-    ),
-    "lt": (_boolean_compare, util.immutabledict({"negate_op": operators.ge})),
-    "le": (_boolean_compare, util.immutabledict({"negate_op": operators.gt})),
-    "ne": (_boolean_compare, util.immutabledict({"negate_op": operators.eq})),
-    "gt": (_boolean_compare, util.immutabledict({"negate_op": operators.le})),
-    "ge": (_boolean_compare, util.immutabledict({"negate_op": operators.lt})),
-    "eq": (_boolean_compare, util.immutabledict({"negate_op": operators.ne})),
-    "is_distinct_from": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.is_not_distinct_from}),
-    ),
-    "is_not_distinct_from": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.is_distinct_from}),
-    ),
-    "like_op": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.not_like_op}),
-    ),
-    "ilike_op": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.not_ilike_op}),
-    ),
-    "not_like_op": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.like_op}),
-    ),
-    "not_ilike_op": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.ilike_op}),
-    ),
-    "contains_op": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.not_contains_op}),
-    ),
-    "startswith_op": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.not_startswith_op}),
-    ),
-    "endswith_op": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.not_endswith_op}),
-    ),
-    "desc_op": (
-        _scalar,
-        util.immutabledict({"fn": UnaryExpression._create_desc}),
-    ),
-    "asc_op": (
-        _scalar,
-        util.immutabledict({"fn": UnaryExpression._create_asc}),
-    ),
-    "nulls_first_op": (
-        _scalar,
-        util.immutabledict({"fn": UnaryExpression._create_nulls_first}),
-    ),
-    "nulls_last_op": (
-        _scalar,
-        util.immutabledict({"fn": UnaryExpression._create_nulls_last}),
-    ),
-    "in_op": (
-        _in_impl,
-        util.immutabledict({"negate_op": operators.not_in_op}),
-    ),
-    "not_in_op": (
-        _in_impl,
-        util.immutabledict({"negate_op": operators.in_op}),
-    ),
-    "is_": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.is_}),
-    ),
-    "is_not": (
-        _boolean_compare,
-        util.immutabledict({"negate_op": operators.is_not}),
-    ),
-    "collate": (_collate_impl, util.EMPTY_DICT),
-    "match_op": (_match_impl, util.EMPTY_DICT),
-    "not_match_op": (_match_impl, util.EMPTY_DICT),
-    "distinct_op": (_distinct_impl, util.EMPTY_DICT),
-    "between_op": (_between_impl, util.EMPTY_DICT),
-    "not_between_op": (_between_impl, util.EMPTY_DICT),
-    "neg": (_neg_impl, util.EMPTY_DICT),
-    "getitem": (_getitem_impl, util.EMPTY_DICT),
-    "lshift": (_unsupported_impl, util.EMPTY_DICT),
-    "rshift": (_unsupported_impl, util.EMPTY_DICT),
-    "contains": (_unsupported_impl, util.EMPTY_DICT),
-    "regexp_match_op": (_regexp_match_impl, util.EMPTY_DICT),
-    "not_regexp_match_op": (_regexp_match_impl, util.EMPTY_DICT),
-    "regexp_replace_op": (_regexp_replace_impl, util.EMPTY_DICT),
+# modifiers of a regexp_match() without flags, shared among all such
+# expressions as BinaryExpression.modifiers is not mutated in place.
+# the "flags" key is kept as dialects look for it unconditionally
+_REGEXP_NO_FLAGS = util.immutabledict({"flags": None})
+
+
+# a read-only mapping of operator names to the function implementing
+# each; fixed arguments such as negate_op are bound using partial().
+operator_lookup: Mapping[
+    str, Callable[..., "ColumnElement"]
+] = util.immutabledict(
+    {
+        "and_": _conjunction_operate,
+        "or_": _conjunction_operate,
+        "inv": _inv_impl,
+        "add": _binary_operate,
+        "mul": _binary_operate,
+        "sub": _binary_operate,
+        "div": _binary_operate,
+        "mod": _binary_operate,
+        "truediv": _binary_operate,
+        "floordiv": _binary_operate,
+        "custom_op": _custom_op_operate,
+        "json_path_getitem_op": _binary_operate,
+        "json_getitem_op": _binary_operate,
+        "concat_op": _binary_operate,
+        "any_op": util.partial(_scalar, fn=CollectionAggregate._create_any),
+        "all_op": util.partial(_scalar, fn=CollectionAggregate._create_all),
+        "lt": _boolean_compare_for(operators.ge),
+        "le": _boolean_compare_for(operators.gt),
+        "ne": _boolean_compare_for(operators.eq),
+        "gt": _boolean_compare_for(operators.le),
+        "ge": _boolean_compare_for(operators.lt),
+        "eq": _boolean_compare_for(operators.ne),
+        "is_distinct_from": _boolean_compare_for(
+            operators.is_not_distinct_from
+        ),
+        "is_not_distinct_from": _boolean_compare_for(
+            operators.is_distinct_from
+        ),
+        "like_op": _boolean_compare_for(operators.not_like_op),
+        "ilike_op": _boolean_compare_for(operators.not_ilike_op),
+        "not_like_op": _boolean_compare_for(operators.like_op),
+        "not_ilike_op": _boolean_compare_for(operators.ilike_op),
+        "contains_op": _boolean_compare_for(operators.not_contains_op),
+        "startswith_op": _boolean_compare_for(operators.not_startswith_op),
+        "endswith_op": _boolean_compare_for(operators.not_endswith_op),
+        "desc_op": util.partial(_scalar, fn=UnaryExpression._create_desc),
+        "asc_op": util.partial(_scalar, fn=UnaryExpression._create_asc),
+        "nulls_first_op": util.partial(
+            _scalar, fn=UnaryExpression._create_nulls_first
+        ),
+        "nulls_last_op": util.partial(
+            _scalar, fn=UnaryExpression._create_nulls_last
+        ),
+        "in_op": util.partial(
+            _in_impl, compare=_boolean_compare_for(operators.not_in_op)
+        ),
+        "not_in_op": util.partial(
+            _in_impl, compare=_boolean_compare_for(operators.in_op)
+        ),
+        "is_": _boolean_compare_for(operators.is_),
+        "is_not": _boolean_compare_for(operators.is_not),
+        "collate": _collate_impl,
+        "match_op": util.partial(
+            _match_impl, negate_op=operators.not_match_op
+        ),
+        "not_match_op": util.partial(
+            _match_impl, negate_op=operators.match_op
+        ),
+        "distinct_op": _distinct_impl,
+        "between_op": _between_impl,
+        "not_between_op": _between_impl,
+        "neg": _neg_impl,
+        "getitem": _getitem_impl,
+        "lshift": _unsupported_impl,
+        "rshift": _unsupported_impl,
+        "contains": _unsupported_impl,
+        "regexp_match_op": util.partial(
+            _regexp_match_impl,
+            negate_op=operators.not_regexp_match_op,
+            compare_no_flags=_boolean_compare_for(
+                operators.not_regexp_match_op, _REGEXP_NO_FLAGS
+            ),
+        ),
+        "not_regexp_match_op": util.partial(
+            _regexp_match_impl,
+            negate_op=operators.regexp_match_op,
+            compare_no_flags=_boolean_compare_for(
+                operators.regexp_match_op, _REGEXP_NO_FLAGS
+            ),
+        ),
+        "regexp_replace_op": _regexp_replace_impl,
+    }
+)
+
+
+# the same functions keyed on the operator object itself.  operators
+# not present here, such as individual custom_op instances, are
+# located by name using operator_lookup.
+_operator_dispatch: Dict[OperatorType, Callable[..., "ColumnElement"]] = {
+    getattr(operators, name): fn
+    for name, fn in operator_lookup.items()
+    if hasattr(operators, name)
 }
@@ -2323,6 +2323,40 @@ class ClauseList(
         self._is_implicitly_boolean = False
         return self
 
+    @classmethod
+    def _construct_for_coerced(
+        cls,
+        *clauses,
+        operator=operators.comma_op,
+        group=True,
+        group_contents=True,
+        _literal_as_text_role: Type[roles.SQLRole] = roles.WhereHavingRole,
+    ):
+        """Produce a :class:`.ClauseList` from elements that are already
+        coerced, establishing the same state as the constructor without
+        invoking :func:`.coercions.expect` on each element.
+
+        """
+        self = cls.__new__(cls)
+        self.operator = operator
+        self.group = group
+        self.group_contents = group_contents
+        self._text_converter_role = _literal_as_text_role
+
+        for clause in clauses:
+            if clause._propagate_attrs:
+                self._propagate_attrs = clause._propagate_attrs
+                break
+
+        if group_contents:
+            self.clauses = [
+                clause.self_group(against=operator) for clause in clauses
+            ]
+        else:
+            self.clauses = list(clauses)
+        self._is_implicitly_boolean = operators.is_boolean(operator)
+        return self
+
     def __iter__(self):
         return iter(self.clauses)
 
@@ -18,6 +18,7 @@ from typing import Type
 from typing import TypeVar
 from typing import Union
 
+from . import operators
 from .base import SchemaEventTarget
 from .cache_key import NO_CACHE
 from .operators import ColumnOperators
@@ -32,7 +33,6 @@ if not typing.TYPE_CHECKING:
     NULLTYPE = None
     STRINGTYPE = None
     MATCHTYPE = None
-    INDEXABLE = None
     TABLEVALUE = None
     _resolve_value_to_type = None
 
@@ -41,7 +41,6 @@ if typing.TYPE_CHECKING:
     from .operators import OperatorType
     from .sqltypes import _resolve_value_to_type
     from .sqltypes import Boolean as BOOLEANTYPE  # noqa
-    from .sqltypes import Indexable as INDEXABLE  # noqa
     from .sqltypes import MatchType as MATCHTYPE  # noqa
     from .sqltypes import NULLTYPE
 
@@ -73,6 +72,7 @@ class TypeEngine(Traversible, Generic[_T]):
     _is_table_value = False
     _is_array = False
     _is_type_decorator = False
+    _indexable = False
 
     _block_from_type_affinity = False
 
@@ -117,20 +117,20 @@ class TypeEngine(Traversible, Generic[_T]):
             self, op: "OperatorType", *other, **kwargs
         ) -> "ColumnElement":
             default_comparator = util.preloaded.sql_default_comparator
-            op_fn, addtl_kw = default_comparator.operator_lookup[op.__name__]
-            if kwargs:
-                addtl_kw = addtl_kw.union(kwargs)
-            return op_fn(self.expr, op, *other, **addtl_kw)
+            op_fn = default_comparator._operator_dispatch.get(op)
+            if op_fn is None:
+                op_fn = default_comparator.operator_lookup[op.__name__]
+            return op_fn(self.expr, op, *other, **kwargs)
 
         @util.preload_module("sqlalchemy.sql.default_comparator")
         def reverse_operate(
             self, op: "OperatorType", other, **kwargs
         ) -> "ColumnElement":
             default_comparator = util.preloaded.sql_default_comparator
-            op_fn, addtl_kw = default_comparator.operator_lookup[op.__name__]
-            if kwargs:
-                addtl_kw = addtl_kw.union(kwargs)
-            return op_fn(self.expr, op, other, reverse=True, **addtl_kw)
+            op_fn = default_comparator._operator_dispatch.get(op)
+            if op_fn is None:
+                op_fn = default_comparator.operator_lookup[op.__name__]
+            return op_fn(self.expr, op, other, reverse=True, **kwargs)
 
         def _adapt_expression(
             self, op: "OperatorType", other_comparator
@@ -1414,13 +1414,17 @@ class TypeDecorator(ExternalType, SchemaEventTarget, TypeEngine[_T]):
         __slots__ = ()
 
         def operate(self, op, *other, **kwargs):
-            kwargs["_python_is_types"] = self.expr.type.coerce_to_is_types
+            # coerce_to_is_types only applies to comparisons; other
+            # operators don't accept it
+            if operators.is_comparison(op):
+                kwargs["_python_is_types"] = self.expr.type.coerce_to_is_types
             return super(TypeDecorator.Comparator, self).operate(
                 op, *other, **kwargs
             )
 
         def reverse_operate(self, op, other, **kwargs):
-            kwargs["_python_is_types"] = self.expr.type.coerce_to_is_types
+            if operators.is_comparison(op):
+                kwargs["_python_is_types"] = self.expr.type.coerce_to_is_types
             return super(TypeDecorator.Comparator, self).reverse_operate(
                 op, other, **kwargs
             )
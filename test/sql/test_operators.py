@@ -16,6 +16,7 @@ from sqlalchemy import or_
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import text
+from sqlalchemy import util
 from sqlalchemy.dialects import mssql
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects import oracle
@@ -32,6 +33,7 @@ from sqlalchemy.sql import coercions
 from sqlalchemy.sql import collate
 from sqlalchemy.sql import column
 from sqlalchemy.sql import compiler
+from sqlalchemy.sql import default_comparator
 from sqlalchemy.sql import desc
 from sqlalchemy.sql import false
 from sqlalchemy.sql import LABEL_STYLE_TABLENAME_PLUS_COL
@@ -191,6 +193,69 @@ class DefaultColumnComparatorTest(
         # and we don't get to know it's "reverse"
         self.assert_compile(True == column("q"), "q = true", dialect=d)
 
+    @testing.combinations(
+        (operators.eq, None, null),
+        (operators.ne, None, null),
+        (operators.is_, True, true),
+        (operators.eq, True, true),
+        (operators.is_not, False, false),
+        (operators.is_distinct_from, False, false),
+        argnames="operator, value, constant",
+    )
+    def test_python_constants_use_singletons(self, operator, value, constant):
+        expr = column("q").comparator.operate(operator, value)
+        is_(expr.right, constant())
+
+    @testing.combinations(
+        (null, "q IS NULL"),
+        (true, "q = true"),
+        (false, "q = false"),
+        argnames="constant, expected",
+    )
+    def test_annotated_constants(self, constant, expected):
+        d = default.DefaultDialect()
+        d.supports_native_boolean = True
+
+        self.assert_compile(
+            column("q") == constant()._annotate({"foo": "bar"}),
+            expected,
+            dialect=d,
+        )
+
+    def test_operator_lookup_matches_dispatch(self):
+        operator_lookup = default_comparator.operator_lookup
+
+        for name, fn in operator_lookup.items():
+            if hasattr(operators, name):
+                is_(
+                    default_comparator._operator_dispatch[
+                        getattr(operators, name)
+                    ],
+                    fn,
+                )
+
+        with expect_raises_message(TypeError, "object is immutable"):
+            operator_lookup["eq"] = operator_lookup["ne"]
+
+    def test_any_all_expr_not_a_modifier(self):
+        expr = default_comparator._boolean_compare(
+            column("q"), operators.eq, 5, _any_all_expr=True
+        )
+        eq_(expr.modifiers, {})
+
+    @testing.combinations(
+        lambda c: c == 5,
+        lambda c: c == None,  # noqa: E711
+        lambda c: c < c,
+        lambda c: c + 5,
+        lambda c: c.in_([1, 2]),
+        lambda c: c.op("->")(5),
+        argnames="fn",
+    )
+    def test_empty_modifiers_shared(self, fn):
+        expr = fn(column("q", Integer))
+        is_(expr.modifiers, util.EMPTY_DICT)
+
     def test_no_getitem(self):
         assert_raises_message(
             NotImplementedError,
@@ -1379,6 +1444,49 @@ class ConjunctionTest(fixtures.TestBase, testing.AssertsCompiledSQL):
 
         self.assert_compile(or_(True, False), "true")
 
+    @combinations(
+        (operator.and_, and_, "AND"),
+        (operator.or_, or_, "OR"),
+        argnames="op, fn, opstring",
+    )
+    def test_chained_operator_is_flat(self, op, fn, opstring):
+        a, b, c, d = column("a"), column("b"), column("c"), column("d")
+
+        expr = op(op(op(a == 1, b == 2), c == 3), d == 4)
+        is_(expr.__class__, BooleanClauseList)
+        eq_(len(expr.clauses), 4)
+        self.assert_compile(
+            expr,
+            "a = :a_1 %(op)s b = :b_1 %(op)s c = :c_1 %(op)s d = :d_1"
+            % {"op": opstring},
+        )
+
+        expr = op(fn(a == 1, b == 2), fn(c == 3, d == 4))
+        eq_(len(expr.clauses), 4)
+        assert expr.compare(fn(a == 1, b == 2, c == 3, d == 4))
+
+    @combinations(
+        (operator.and_, true(), "x = :x_1"),
+        (operator.and_, True, "x = :x_1"),
+        (operator.and_, false(), "false"),
+        (operator.and_, text("y = 1"), "x = :x_1 AND y = 1"),
+        (operator.or_, false(), "x = :x_1"),
+        (operator.or_, False, "x = :x_1"),
+        (operator.or_, true(), "true"),
+        (operator.or_, text("y = 1"), "x = :x_1 OR y = 1"),
+        argnames="op, other, expected",
+    )
+    def test_operator_w_constant(self, op, other, expected):
+        x = column("x")
+        self.assert_compile(op(x == 5, other), expected)
+
+    def test_chained_mixed_operators_not_flattened(self):
+        a, b, c = column("a"), column("b"), column("c")
+
+        expr = ((a == 1) | (b == 2)) & (c == 3)
+        eq_(len(expr.clauses), 2)
+        self.assert_compile(expr, "(a = :a_1 OR b = :b_1) AND c = :c_1")
+
 
 class OperatorPrecedenceTest(fixtures.TestBase, testing.AssertsCompiledSQL):
     __dialect__ = "default"
@@ -1800,6 +1908,42 @@ class InTest(fixtures.TestBase, testing.AssertsCompiledSQL):
             checkparams={"myid_1": ["a"]},
         )
 
+    @testing.combinations(
+        (operators.in_op, [1, 2, 3]),
+        (operators.in_op, (1, 2, 3)),
+        (operators.in_op, []),
+        (operators.not_in_op, [1, 2, 3]),
+        argnames="operator, value",
+    )
+    def test_in_plain_sequence(self, operator, value):
+        expr = operator(self.table1.c.myid, value)
+
+        bind = expr.right
+        is_(bind.__class__, BindParameter)
+        is_(bind.expanding, True)
+        is_(bind.expand_op, operator)
+        eq_(bind.value, list(value))
+        is_(bind.type._type_affinity, Integer)
+
+        assert expr.compare(
+            operator(self.table1.c.myid, iter(value)), compare_values=True
+        )
+
+    def test_in_plain_sequence_copied(self):
+        value = [1, 2, 3]
+        bind = self.table1.c.myid.in_(value).right
+
+        value.append(4)
+        eq_(bind.value, [1, 2, 3])
+
+    @testing.combinations(
+        ([1, 2, None], "mytable.myid IN (:myid_1, :myid_2, NULL)"),
+        ([1, 2, column("q")], "mytable.myid IN (:myid_1, :myid_2, q)"),
+        argnames="value, expected",
+    )
+    def test_in_sequence_non_literal_last(self, value, expected):
+        self.assert_compile(self.table1.c.myid.in_(value), expected)
+
     def test_in_2(self):
         self.assert_compile(
             ~self.table1.c.myid.in_(["a"]),
@@ -2647,6 +2791,81 @@ class BetweenTest(fixtures.TestBase, testing.AssertsCompiledSQL):
             "mytable.myid NOT BETWEEN SYMMETRIC :myid_1 AND :myid_2",
         )
 
+    def test_between_bounds(self):
+        expr = self.table1.c.myid.between(1, self.table1.c.myid + 5)
+
+        bounds = expr.right
+        is_(bounds.__class__, ClauseList)
+        is_(bounds.operator, operators.and_)
+        is_(bounds.group, False)
+        is_(bounds.group_contents, False)
+        assert bounds.compare(
+            ClauseList(
+                literal(1, Integer),
+                self.table1.c.myid + 5,
+                operator=operators.and_,
+                group=False,
+                group_contents=False,
+            )
+        )
+
+        self.assert_compile(
+            (expr & self.table1.c.name.between("a", "b")),
+            "mytable.myid BETWEEN :myid_1 AND mytable.myid + :myid_2 "
+            "AND mytable.name BETWEEN :name_1 AND :name_2",
+        )
+
+    def test_between_bounds_append(self):
+        expr = self.table1.c.myid.between(1, 2)
+
+        bounds = expr.right
+        bounds.append(self.table1.c.name)
+        eq_(len(bounds.clauses), 3)
+        assert bounds.compare(
+            ClauseList(
+                literal(1, Integer),
+                literal(2, Integer),
+                self.table1.c.name,
+                operator=operators.and_,
+                group=False,
+                group_contents=False,
+            )
+        )
+
+    @testing.combinations(
+        (column("q", Integer), 1, 5),
+        (column("q", String), "a", "z"),
+        (column("q", Numeric(10, 2)), 1, 5.5),
+        (column("q"), None, 5),
+        argnames="col, low, high",
+    )
+    def test_between_literal_bounds(self, col, low, high):
+        bounds = col.between(low, high).right
+
+        for bound, value in zip(bounds.clauses, (low, high)):
+            expected = coercions.expect(
+                roles.BinaryElementRole,
+                value,
+                expr=col,
+                operator=operators.and_,
+            )
+            assert bound.compare(expected, compare_values=True)
+            is_(bound.type._type_affinity, expected.type._type_affinity)
+
+    def test_between_literal_bounds_null_compared_type(self):
+        class MyType(TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def coerce_compared_value(self, op, value):
+                return sqltypes.NullType()
+
+        col = column("q", MyType())
+        bounds = col.between("a", "c").right
+
+        for bound in bounds.clauses:
+            is_(bound.type, col.type)
+
 
 class MatchTest(fixtures.TestBase, testing.AssertsCompiledSQL):
     __dialect__ = "default"
@@ -2814,6 +3033,17 @@ class RegexpTestStrCompiler(fixtures.TestBase, testing.AssertsCompiledSQL):
             checkparams={"myid_1": "pattern"},
         )
 
+    def test_regexp_match_no_flags_modifiers(self):
+        expr1 = self.table.c.myid.regexp_match("pattern")
+        expr2 = self.table.c.name.regexp_match(self.table.c.myid)
+        eq_(expr1.modifiers, {"flags": None})
+        is_(expr1.modifiers, expr2.modifiers)
+        is_(expr1.modifiers, (~expr1).modifiers)
+
+        expr3 = self.table.c.myid.regexp_match("pattern", flags="ig")
+        eq_(expr3.modifiers["flags"].value, "ig")
+        is_not(expr1.modifiers, expr3.modifiers)
+
     def test_regexp_replace(self):
         self.assert_compile(
             self.table.c.myid.regexp_replace("pattern", "replacement"),
@@ -3205,6 +3205,26 @@ class ExpressionTest(
             dialect=default.DefaultDialect(supports_native_boolean=True),
         )
 
+    def test_typedec_non_comparison_ops(self):
+        class MyTypeDec(TypeDecorator):
+            impl = Integer
+            cache_ok = True
+
+        c1 = column("x", MyTypeDec())
+
+        self.assert_compile(
+            select(c1 + 5, -c1, c1.distinct()).order_by(
+                c1.desc(), c1.collate("q")
+            ),
+            "SELECT x + :x_1 AS anon_1, -x, DISTINCT x "
+            "ORDER BY x DESC, x COLLATE q",
+        )
+        self.assert_compile(
+            (c1 == 5) & (c1 == None) | ~(c1 == 7),  # noqa
+            "x = :x_1 AND x IS NULL OR x != :x_2",
+        )
+        eq_((c1 + 5).modifiers, {})
+
     def test_typedec_righthand_coercion(self, connection):
         class MyTypeDec(types.TypeDecorator):
             impl = String
@@ -3361,6 +3381,22 @@ class ExpressionTest(
         is_(expr.type.asdecimal, False)
         assert isinstance(expr.type, Float)
 
+    @testing.combinations((10,), (20,), argnames="length")
+    def test_adapted_type_per_instance(self, length):
+        """the type produced by an operator is derived from the type
+        objects involved, not only from their classes."""
+
+        expr = column("a", String(length)) + column("b", String(5))
+        eq_(expr.type.length, length)
+
+        expr = column(
+            "a", Enum("x", "y", length=length, native_enum=False)
+        ) + column("b", String)
+        eq_(expr.type.length, length)
+
+        expr = column("a", Numeric(length, 2)) + column("b", Integer)
+        eq_(expr.type.precision, length)
+
     def test_null_comparison(self):
         eq_(
             str(column("a", types.NullType()) + column("b", types.NullType())),